@@ -93,6 +93,9 @@ a = Analysis(
         'torch',
         'tensorflow',
         'keras',
+        # Bundled test suites (never imported at runtime)
+        'numpy.tests',
+        'pandas.tests',
     ],
     win_no_prefer_redirects=False,
     win_private_assemblies=False,
@@ -114,7 +117,7 @@ exe = EXE(
     debug=False,
     bootloader_ignore_signals=False,
     strip=False,
-    upx=True,
+    upx=False,  # UPX-packed binaries are decompressed in memory on every launch
     console=False,
     disable_windowed_traceback=False,
     argv_emulation=False,
@@ -129,7 +132,7 @@ coll = COLLECT(
     a.zipfiles,
     a.datas,
     strip=False,
-    upx=True,
+    upx=False,
     upx_exclude=[],
     name='LiftText',
 )
@@ -5,11 +5,57 @@ LiftText Image Text Extractor - Entry Point
 This file serves as the entry point for the application.
 The main application code is in the ocr_app package.
 """
+import atexit
+import logging
+import logging.handlers
+import os
+import queue
 import sys
+import tempfile
+
+
+def setup_logging():
+    """Route the app's 'lifttext' log records to stderr, or to a log file when bundled.
+
+    Only the 'lifttext' logger is configured; third-party loggers keep their defaults.
+    """
+    log = logging.getLogger('lifttext')
+    log.setLevel(logging.INFO)
+
+    if not getattr(sys, '_MEIPASS', None):
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter('%(levelname)s: %(message)s'))
+        log.addHandler(handler)
+        return
+
+    # Bundled app: stdout goes nowhere useful, so write to a file. The file is
+    # written by a listener thread so the UI thread never blocks on disk I/O.
+    if sys.platform == 'darwin':
+        log_dir = os.path.expanduser('~/Library/Logs')
+    else:
+        log_dir = tempfile.gettempdir()
+    try:
+        os.makedirs(log_dir, exist_ok=True)
+        file_handler = logging.FileHandler(os.path.join(log_dir, 'LiftText.log'), encoding='utf-8')
+    except OSError:
+        return  # Warnings and errors still reach stderr via logging's last-resort handler
+    file_handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(name)s: %(message)s'))
+
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, file_handler)
+    listener.start()
+    atexit.register(listener.stop)
+
+    log.addHandler(logging.handlers.QueueHandler(log_queue))
+
+
+setup_logging()
+
 from ocr_app.utils.resources import setup_bundled_models
 
 # CRITICAL: Setup bundled models BEFORE importing PaddleOCR
-# This must happen before the ocr_app modules are imported
+# PaddleOCR is imported lazily (OCRWorker.run / preload_ocr_engine), but the
+# environment must be in place before anything can trigger that import
 setup_bundled_models()
 
 # Now safe to import the main application
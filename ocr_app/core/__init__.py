@@ -1,4 +1,4 @@
-from .ocr_worker import OCRWorker
+from .ocr_worker import OCRWorker, preload_ocr_engine
 from .pdf_handler import PDFHandler
 
-__all__ = ['OCRWorker', 'PDFHandler']
+__all__ = ['OCRWorker', 'PDFHandler', 'preload_ocr_engine']
@@ -1,29 +1,77 @@
 """Main application window for LiftText Image Text Extractor"""
 import sys
 import os
+import logging
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QLabel, QTextEdit, QFileDialog, QScrollArea,
     QProgressBar, QSplitter, QDialog
 )
-from PySide6.QtCore import Qt, QSettings, QDir, QSize
-from PySide6.QtGui import QPixmap, QPalette, QColor, QFont
+from PySide6.QtCore import Qt, Signal, QSettings, QDir, QSize, QTimer, QThreadPool
+from PySide6.QtGui import QPixmap, QPixmapCache, QPalette, QColor, QFont
 from qt_material_icons import MaterialIcon
 from PIL import Image
 import tempfile
 
-from ocr_app.core import OCRWorker, PDFHandler
+try:
+    from qt_material import apply_stylesheet
+except ImportError:
+    apply_stylesheet = None
+
+from ocr_app.core import OCRWorker, PDFHandler, preload_ocr_engine
 from ocr_app.ui.widgets import ImageWithBoxes, FileExplorerWidget
 from ocr_app.ui.dialogs import SettingsDialog
+from ocr_app.ui.styles import build_app_stylesheet
 from ocr_app.utils.constants import (
-    DETECTION_MODELS, RECOGNITION_MODELS,
+    DETECTION_MODELS, RECOGNITION_MODELS, AVAILABLE_THEMES,
     SETTINGS_DET_MODEL, SETTINGS_REC_MODEL, SETTINGS_LANGUAGE, SETTINGS_THEME,
-    SETTINGS_SPLITTER_SIZES, DEFAULT_DET_MODEL, DEFAULT_REC_MODEL,
-    DEFAULT_LANGUAGE, DEFAULT_THEME, DEFAULT_SPLITTER_SIZES
+    SETTINGS_SPLITTER_SIZES, SETTINGS_CACHE_ENABLED, SETTINGS_CACHE_MAX_MB,
+    DEFAULT_DET_MODEL, DEFAULT_REC_MODEL, DEFAULT_LANGUAGE, DEFAULT_THEME,
+    DEFAULT_SPLITTER_SIZES, DEFAULT_CACHE_ENABLED, DEFAULT_CACHE_MAX_MB, SUPPORTED_FILE_EXTENSIONS
 )
 
+_log = logging.getLogger('lifttext.ui')
+
+# Theme filename -> display name, e.g. 'light_blue.xml' -> 'Light Blue'
+_THEME_LABELS = {theme_file: theme_name for theme_name, theme_file in AVAILABLE_THEMES}
+
+# MaterialIcon rasterizes a font glyph on construction; share one QIcon per name
+_ICON_CACHE = {}
+
+
+def _icon(name):
+    """Return a cached MaterialIcon for the given icon name"""
+    icon = _ICON_CACHE.get(name)
+    if icon is None:
+        icon = _ICON_CACHE[name] = MaterialIcon(name)
+    return icon
+
+
+def apply_theme(app, theme):
+    """Apply the qt-material theme, then the app-wide LiftText stylesheet on top of it"""
+    # Re-applying a theme repolishes every widget; skip it if this theme is already active
+    if app.property('lifttext_theme') == theme:
+        return
+
+    if apply_stylesheet is None:
+        _log.warning("qt-material not installed. Using default Qt styling.")
+    else:
+        try:
+            apply_stylesheet(app, theme=theme)
+        except Exception as e:
+            _log.warning("Could not apply theme: %s", e)
+
+    # apply_stylesheet() replaces the application stylesheet, so re-append ours
+    existing_style = app.styleSheet()
+    app_style = build_app_stylesheet()
+    if not existing_style.endswith(app_style):
+        app.setStyleSheet(existing_style + app_style)
+    app.setProperty('lifttext_theme', theme)
+
 
 class OCRApp(QMainWindow):
+    ocr_engine_preloaded = Signal(bool)  # Emitted from the thread pool when the preload finishes
+
     def __init__(self):
         super().__init__()
         self.image_path = None
@@ -50,6 +98,7 @@ class OCRApp(QMainWindow):
         })
 
         self.init_ui()
+        self.ocr_engine_preloaded.connect(self.on_ocr_engine_preloaded)
 
     def _load_settings(self):
         """Load application settings from QSettings"""
@@ -70,27 +119,6 @@ class OCRApp(QMainWindow):
         self.setWindowTitle("LiftText")
         self.setGeometry(100, 100, 1000, 700)
 
-        # Apply global button styling
-        self.setStyleSheet("""
-            QPushButton {
-                background-color: rgb(8, 134, 71) !important;
-                color: white !important;
-                border: 1px solid rgb(237, 237, 237) !important;
-            }
-            QPushButton:hover {
-                background-color: rgb(6, 110, 58) !important;
-                border: 1px solid rgb(150, 150, 150) !important;
-            }
-            QPushButton:pressed {
-                background-color: rgb(5, 90, 47) !important;
-                border: 1px solid rgb(120, 120, 120) !important;
-            }
-            QPushButton:disabled {
-                background-color: rgb(150, 150, 150) !important;
-                color: rgb(200, 200, 200) !important;
-            }
-        """)
-
         # Create menu bar
         self._create_menu_bar()
 
@@ -137,7 +165,7 @@ class OCRApp(QMainWindow):
         # Edit menu
         edit_menu = menubar.addMenu("&Edit")
         settings_action = edit_menu.addAction("Settings...")
-        settings_action.setIcon(MaterialIcon('settings'))
+        settings_action.setIcon(_icon('settings'))
         settings_action.setShortcut("Ctrl+,")
         settings_action.triggered.connect(self.show_settings_dialog)
 
@@ -152,7 +180,7 @@ class OCRApp(QMainWindow):
 
         # Search/Upload button at the top
         self.upload_btn = QPushButton()
-        self.upload_btn.setIcon(MaterialIcon('search'))
+        self.upload_btn.setIcon(_icon('search'))
         self.upload_btn.setIconSize(QSize(24, 24))
         self.upload_btn.setToolTip("Upload Image or PDF")
         self.upload_btn.setMinimumSize(40, 40)
@@ -165,7 +193,7 @@ class OCRApp(QMainWindow):
 
         # Settings button at the bottom
         settings_btn = QPushButton()
-        settings_btn.setIcon(MaterialIcon('settings'))
+        settings_btn.setIcon(_icon('settings'))
         settings_btn.setIconSize(QSize(24, 24))
         settings_btn.setToolTip("Settings (Ctrl+,)")
         settings_btn.setMinimumSize(40, 40)
@@ -239,7 +267,7 @@ class OCRApp(QMainWindow):
 
         # Selection mode toggle button
         self.select_area_btn = QPushButton()
-        self.select_area_btn.setIcon(MaterialIcon('crop_free'))
+        self.select_area_btn.setIcon(_icon('crop_free'))
         self.select_area_btn.setIconSize(QSize(20, 20))
         self.select_area_btn.setToolTip("Select Area")
         self.select_area_btn.setMaximumWidth(40)
@@ -285,7 +313,7 @@ class OCRApp(QMainWindow):
 
         # Zoom controls (initially hidden)
         self.zoom_in_btn = QPushButton()
-        self.zoom_in_btn.setIcon(MaterialIcon('zoom_in'))
+        self.zoom_in_btn.setIcon(_icon('zoom_in'))
         self.zoom_in_btn.setToolTip("Zoom In (+)")
         self.zoom_in_btn.setIconSize(QSize(24, 24))
         self.zoom_in_btn.setMinimumSize(40, 40)
@@ -293,7 +321,7 @@ class OCRApp(QMainWindow):
         left_toolbar_layout.addWidget(self.zoom_in_btn)
 
         self.zoom_out_btn = QPushButton()
-        self.zoom_out_btn.setIcon(MaterialIcon('zoom_out'))
+        self.zoom_out_btn.setIcon(_icon('zoom_out'))
         self.zoom_out_btn.setToolTip("Zoom Out (-)")
         self.zoom_out_btn.setIconSize(QSize(24, 24))
         self.zoom_out_btn.setMinimumSize(40, 40)
@@ -301,7 +329,7 @@ class OCRApp(QMainWindow):
         left_toolbar_layout.addWidget(self.zoom_out_btn)
 
         self.zoom_reset_btn = QPushButton()
-        self.zoom_reset_btn.setIcon(MaterialIcon('zoom_out_map'))
+        self.zoom_reset_btn.setIcon(_icon('zoom_out_map'))
         self.zoom_reset_btn.setToolTip("Reset Zoom")
         self.zoom_reset_btn.setIconSize(QSize(24, 24))
         self.zoom_reset_btn.setMinimumSize(40, 40)
@@ -313,7 +341,7 @@ class OCRApp(QMainWindow):
 
         # PDF pagination controls (initially hidden, shown only for PDFs)
         self.prev_page_btn = QPushButton()
-        self.prev_page_btn.setIcon(MaterialIcon('keyboard_arrow_up'))
+        self.prev_page_btn.setIcon(_icon('keyboard_arrow_up'))
         self.prev_page_btn.setToolTip("Previous Page")
         self.prev_page_btn.setIconSize(QSize(24, 24))
         self.prev_page_btn.setMinimumSize(40, 40)
@@ -328,7 +356,7 @@ class OCRApp(QMainWindow):
         left_toolbar_layout.addWidget(self.page_label)
 
         self.next_page_btn = QPushButton()
-        self.next_page_btn.setIcon(MaterialIcon('keyboard_arrow_down'))
+        self.next_page_btn.setIcon(_icon('keyboard_arrow_down'))
         self.next_page_btn.setToolTip("Next Page")
         self.next_page_btn.setIconSize(QSize(24, 24))
         self.next_page_btn.setMinimumSize(40, 40)
@@ -506,6 +534,19 @@ class OCRApp(QMainWindow):
         return splitter
 
     # File loading methods
+    def start_ocr_preload(self):
+        """Build the OCR engine for the saved settings in the background so the first scan reuses it"""
+        self.status_label.setText("Loading OCR models...")
+        det_model, rec_model, language = self.selected_det_model, self.selected_rec_model, self.selected_language
+        QThreadPool.globalInstance().start(
+            lambda: self.ocr_engine_preloaded.emit(preload_ocr_engine(det_model, rec_model, language))
+        )
+
+    def on_ocr_engine_preloaded(self, success):
+        """Clear the loading indicator unless something else has updated the status since"""
+        if self.status_label.text() == "Loading OCR models...":
+            self.status_label.setText("Ready" if success else "OCR models will load on first scan")
+
     def upload_image(self):
         """Upload image via file dialog"""
         file_name, _ = QFileDialog.getOpenFileName(
@@ -620,8 +661,7 @@ class OCRApp(QMainWindow):
 
     def _is_valid_file(self, file_path):
         """Check if file is a valid image or PDF"""
-        valid_extensions = ('.png', '.jpg', '.jpeg', '.bmp', '.gif', '.tiff', '.tif', '.pdf')
-        return file_path.lower().endswith(valid_extensions)
+        return file_path.lower().endswith(SUPPORTED_FILE_EXTENSIONS)
 
     # PDF navigation methods
     def navigate_to_prev_page(self):
@@ -731,7 +771,9 @@ class OCRApp(QMainWindow):
             det_model=self.selected_det_model,
             rec_model=self.selected_rec_model,
             language=self.selected_language,
-            crop_rect=crop_rect
+            crop_rect=crop_rect,
+            use_cache=self.settings.value(SETTINGS_CACHE_ENABLED, DEFAULT_CACHE_ENABLED, type=bool),
+            cache_max_mb=self.settings.value(SETTINGS_CACHE_MAX_MB, DEFAULT_CACHE_MAX_MB, type=int)
         )
         self.ocr_worker.finished.connect(self.on_ocr_complete)
         self.ocr_worker.words_detected.connect(self.on_words_detected)
@@ -884,6 +926,7 @@ class OCRApp(QMainWindow):
 
         if dialog.exec() == QDialog.Accepted:
             new_settings = dialog.get_settings()
+            theme_changed = new_settings['theme'] != self.selected_theme
 
             # Save to instance variables
             self.selected_det_model = new_settings['detection_model']
@@ -891,21 +934,25 @@ class OCRApp(QMainWindow):
             self.selected_language = new_settings['language']
             self.selected_theme = new_settings['theme']
 
-            # Save to QSettings
-            self.settings.setValue(SETTINGS_DET_MODEL, new_settings['detection_model'])
-            self.settings.setValue(SETTINGS_REC_MODEL, new_settings['recognition_model'])
-            self.settings.setValue(SETTINGS_LANGUAGE, new_settings['language'])
-            self.settings.setValue(SETTINGS_THEME, new_settings['theme'])
+            # Save to QSettings (only keys that changed, flushed once)
+            values = {
+                SETTINGS_DET_MODEL: new_settings['detection_model'],
+                SETTINGS_REC_MODEL: new_settings['recognition_model'],
+                SETTINGS_LANGUAGE: new_settings['language'],
+                SETTINGS_THEME: new_settings['theme'],
+            }
+            changed = {key: value for key, value in values.items() if self.settings.value(key) != value}
+            for key, value in changed.items():
+                self.settings.setValue(key, value)
+            if changed:
+                self.settings.sync()
 
-            # Apply theme immediately
-            try:
-                from qt_material import apply_stylesheet
-                apply_stylesheet(QApplication.instance(), theme=new_settings['theme'])
-            except Exception as e:
-                print(f"Warning: Could not apply theme: {e}")
+            # Apply theme on the next event loop pass so the status update paints first
+            if theme_changed:
+                QTimer.singleShot(0, lambda: apply_theme(QApplication.instance(), new_settings['theme']))
 
             # Update status
-            theme_name = new_settings['theme'].replace('.xml', '').replace('_', ' ').title()
+            theme_name = _THEME_LABELS.get(new_settings['theme'], new_settings['theme'])
             self.status_label.setText(
                 f"Settings saved: {new_settings['detection_model']}, "
                 f"{new_settings['recognition_model']}, "
@@ -919,43 +966,19 @@ def main():
     """Application entry point"""
     app = QApplication(sys.argv)
 
-    # Apply Material Design theme
-    try:
-        from qt_material import apply_stylesheet
-        settings = QSettings('LiftText', 'ImageTextExtractor')
-        theme = settings.value('ui/theme', 'light_blue.xml')
-        apply_stylesheet(app, theme=theme)
-    except ImportError:
-        print("Warning: qt-material not installed. Using default Qt styling.")
-    except Exception as e:
-        print(f"Warning: Could not apply theme: {e}")
-
-    # Apply custom button styling after qt_material theme
-    custom_button_style = """
-        QPushButton {
-            background-color: rgb(8, 134, 71) !important;
-            color: white !important;
-            border: 1px solid rgb(237, 237, 237) !important;
-        }
-        QPushButton:hover {
-            background-color: rgb(6, 110, 58) !important;
-            border: 1px solid rgb(150, 150, 150) !important;
-        }
-        QPushButton:pressed {
-            background-color: rgb(5, 90, 47) !important;
-            border: 1px solid rgb(120, 120, 120) !important;
-        }
-        QPushButton:disabled {
-            background-color: rgb(150, 150, 150) !important;
-            color: rgb(200, 200, 200) !important;
-        }
-    """
-    # Append to existing stylesheet
-    existing_style = app.styleSheet()
-    app.setStyleSheet(existing_style + custom_button_style)
+    # The image viewer keeps smoothly scaled zoom levels in the global pixmap cache (limit in KB)
+    QPixmapCache.setCacheLimit(128 * 1024)
+
+    # Apply Material Design theme plus the app-wide LiftText stylesheet
+    settings = QSettings('LiftText', 'ImageTextExtractor')
+    apply_theme(app, settings.value(SETTINGS_THEME, DEFAULT_THEME))
 
     window = OCRApp()
     window.show()
+
+    # Load the OCR engine in the background once the event loop is running, so the
+    # window paints first and the first scan doesn't wait for the model load
+    QTimer.singleShot(0, window.start_ocr_preload)
     sys.exit(app.exec())
 
 
@@ -0,0 +1,117 @@
+"""LiftText Qt stylesheets applied on top of the qt-material theme"""
+from functools import lru_cache
+
+from PySide6.QtGui import QFont
+
+
+# Green action buttons (overrides the qt-material button colors)
+BUTTON_STYLE = """
+    QPushButton {
+        background-color: rgb(8, 134, 71) !important;
+        color: white !important;
+        border: 1px solid rgb(237, 237, 237) !important;
+    }
+    QPushButton:hover {
+        background-color: rgb(6, 110, 58) !important;
+        border: 1px solid rgb(150, 150, 150) !important;
+    }
+    QPushButton:pressed {
+        background-color: rgb(5, 90, 47) !important;
+        border: 1px solid rgb(120, 120, 120) !important;
+    }
+    QPushButton:disabled {
+        background-color: rgb(150, 150, 150) !important;
+        color: rgb(200, 200, 200) !important;
+    }
+"""
+
+# File explorer panel and its tree view (object name 'fileExplorerTree').
+# Set on FileExplorerWidget itself: stylesheets on ancestor widgets (such as the
+# central widget's background rule) take precedence over the application stylesheet
+FILE_EXPLORER_STYLE = """
+    FileExplorerWidget {{
+        background-color: white !important;
+    }}
+    QTreeView#fileExplorerTree {{
+        font-size: {font_size}pt !important;
+        background-color: white !important;
+    }}
+    QTreeView#fileExplorerTree::item {{
+        padding: 0px 2px !important;
+        margin: 0px !important;
+        height: 20px !important;
+        min-height: 20px !important;
+        max-height: 20px !important;
+        background-color: white !important;
+    }}
+    QTreeView#fileExplorerTree::item:selected {{
+        background-color: rgb(0, 120, 215) !important;
+        color: white !important;
+    }}
+    QTreeView#fileExplorerTree::item:hover {{
+        background-color: rgb(229, 243, 255) !important;
+    }}
+    QTreeView#fileExplorerTree::branch {{
+        width: 10px !important;
+        background-color: white !important;
+    }}
+    QTreeView#fileExplorerTree QScrollBar:vertical {{
+        background: rgb(240, 240, 240);
+        width: 8px;
+        border: none;
+    }}
+    QTreeView#fileExplorerTree QScrollBar::handle:vertical {{
+        background: rgb(180, 180, 180);
+        min-height: 20px;
+        border-radius: 2px;
+    }}
+    QTreeView#fileExplorerTree QScrollBar::handle:vertical:hover {{
+        background: rgb(150, 150, 150);
+    }}
+    QTreeView#fileExplorerTree QScrollBar::add-line:vertical,
+    QTreeView#fileExplorerTree QScrollBar::sub-line:vertical {{
+        height: 0px;
+    }}
+    QTreeView#fileExplorerTree QScrollBar:horizontal {{
+        background: rgb(240, 240, 240);
+        height: 8px;
+        border: none;
+    }}
+    QTreeView#fileExplorerTree QScrollBar::handle:horizontal {{
+        background: rgb(180, 180, 180);
+        min-width: 20px;
+        border-radius: 2px;
+    }}
+    QTreeView#fileExplorerTree QScrollBar::handle:horizontal:hover {{
+        background: rgb(150, 150, 150);
+    }}
+    QTreeView#fileExplorerTree QScrollBar::add-line:horizontal,
+    QTreeView#fileExplorerTree QScrollBar::sub-line:horizontal {{
+        width: 0px;
+    }}
+"""
+
+
+@lru_cache(maxsize=None)
+def explorer_font():
+    """Return the file explorer font (80% of default = 20% decrease).
+
+    Computed once; must first be called after the QApplication exists.
+    """
+    default_font = QFont()
+    smaller_font = QFont(default_font)
+    smaller_font.setPointSizeF(default_font.pointSizeF() * 0.8)
+    return smaller_font
+
+
+@lru_cache(maxsize=None)
+def build_app_stylesheet():
+    """Build the stylesheet appended to the qt-material theme at application level (cached)"""
+    return BUTTON_STYLE
+
+
+@lru_cache(maxsize=None)
+def build_explorer_stylesheet():
+    """Build the file explorer widget's stylesheet (cached)"""
+    font_size = int(explorer_font().pointSizeF())
+    return FILE_EXPLORER_STYLE.format(font_size=font_size)
@@ -1,135 +1,102 @@
 """File explorer widget for browsing and selecting image/PDF files"""
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QTreeView, QFileSystemModel
-from PySide6.QtCore import Qt, Signal, QDir, QSize
-from PySide6.QtGui import QFont
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QTreeView, QFileSystemModel, QFileIconProvider
+from PySide6.QtCore import Qt, Signal, QDir, QSize, QThreadPool, QSortFilterProxyModel
 import os
 
+from ocr_app.ui.styles import explorer_font, build_explorer_stylesheet
+from ocr_app.utils.constants import SUPPORTED_FILE_EXTENSIONS
+
+
+class SingleColumnProxy(QSortFilterProxyModel):
+    """Expose only the name column of the source model so the view never queries size/type/date.
+
+    Filtering the columns (rather than just reporting one) also clips the source's
+    dataChanged/layoutChanged ranges, so views never see indexes for hidden columns.
+    """
+
+    def filterAcceptsColumn(self, source_column, source_parent):
+        return source_column == 0
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        # Let QFileSystemModel sort (directories first) and keep its row order as-is
+        self.sourceModel().sort(column, order)
+
 
 class FileExplorerWidget(QWidget):
     """File explorer widget with image file filtering"""
     file_selected = Signal(str)  # Emits absolute file path when image selected
     upload_requested = Signal()  # Emits when upload button is clicked
+    restore_directory_checked = Signal(str)  # Emitted from a pool thread with the directory to show
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self.settings = None  # Set by parent
         self.current_directory = QDir.homePath()
+        self._pending_scroll_path = None  # Directory to scroll to once the model has loaded it
         self.init_ui()
+        # Queued back to the UI thread, since the check runs on the thread pool
+        self.restore_directory_checked.connect(self.set_root_path)
 
     def init_ui(self):
         """Initialize the file explorer UI"""
-        # Set background color to white using both palette and stylesheet
+        # White background: the palette covers the panel itself, the stylesheet
+        # (applied below) covers the tree, its items and scrollbars
         from PySide6.QtGui import QPalette, QColor
         palette = self.palette()
         palette.setColor(QPalette.Window, QColor(255, 255, 255))
         palette.setColor(QPalette.Base, QColor(255, 255, 255))
         self.setPalette(palette)
         self.setAutoFillBackground(True)
-        # Also set stylesheet to ensure white background
-        self.setStyleSheet("FileExplorerWidget { background-color: white !important; }")
+        self.setStyleSheet(build_explorer_stylesheet())
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
 
-        # Configure font size (80% of default = 20% decrease)
-        default_font = QFont()
-        smaller_font = QFont(default_font)
-        smaller_font.setPointSizeF(default_font.pointSizeF() * 0.8)
-
         # File system model
         self.file_model = QFileSystemModel()
-        self.file_model.setRootPath(QDir.rootPath())
-
-        # Image and PDF file filters (only show these extensions)
-        self.file_model.setNameFilters([
-            '*.png', '*.PNG',
-            '*.jpg', '*.JPG', '*.jpeg', '*.JPEG',
-            '*.bmp', '*.BMP',
-            '*.gif', '*.GIF',
-            '*.tiff', '*.TIFF', '*.tif', '*.TIF',
-            '*.pdf', '*.PDF'
-        ])
+
+        # Skip per-directory custom icon lookups (slow on network mounts and huge folders).
+        # Keep a reference: the model does not take ownership of the provider.
+        self.icon_provider = QFileIconProvider()
+        self.icon_provider.setOptions(QFileIconProvider.DontUseCustomDirectoryIcons)
+        self.file_model.setIconProvider(self.icon_provider)
+
+        # Only watch the active subtree instead of the whole file system
+        self.file_model.setRootPath(self.current_directory)
+
+        # Image and PDF file filters (only show these extensions).
+        # QFileSystemModel matches name filters case-insensitively unless QDir.CaseSensitive
+        # is set, so lowercase patterns also cover *.PNG, *.JPG, etc.
+        self.file_model.setNameFilters(['*' + ext for ext in SUPPORTED_FILE_EXTENSIONS])
         self.file_model.setNameFilterDisables(False)  # Hide non-matching files
+        self.file_model.directoryLoaded.connect(self._on_directory_loaded)
+
+        # Only the name column is shown; the proxy hides the others from the view entirely.
+        # View indexes belong to the proxy - map them with mapToSource()/mapFromSource().
+        self.proxy_model = SingleColumnProxy(self)
+        self.proxy_model.setSourceModel(self.file_model)
 
         # Tree view
         self.tree_view = QTreeView()
-        self.tree_view.setModel(self.file_model)
+        self.tree_view.setModel(self.proxy_model)
+        # Rows are fixed at 20px by the stylesheet, so skip per-row height computation
+        self.tree_view.setUniformRowHeights(True)
         # Don't set root index - allow navigation to entire file system
         # self.tree_view.setRootIndex(self.file_model.index(QDir.homePath()))
 
-        # Configure tree view appearance
-        self.tree_view.setFont(smaller_font)
-        # Use stylesheet to override Material Design theme font
-        font_size = int(smaller_font.pointSizeF())
-        self.tree_view.setStyleSheet(f"""
-            QTreeView {{
-                font-size: {font_size}pt !important;
-                background-color: white !important;
-            }}
-            QTreeView::item {{
-                padding: 0px 2px !important;
-                margin: 0px !important;
-                height: 20px !important;
-                min-height: 20px !important;
-                max-height: 20px !important;
-                background-color: white !important;
-            }}
-            QTreeView::item:selected {{
-                background-color: rgb(0, 120, 215) !important;
-                color: white !important;
-            }}
-            QTreeView::item:hover {{
-                background-color: rgb(229, 243, 255) !important;
-            }}
-            QTreeView::branch {{
-                width: 10px !important;
-                background-color: white !important;
-            }}
-            QScrollBar:vertical {{
-                background: rgb(240, 240, 240);
-                width: 8px;
-                border: none;
-            }}
-            QScrollBar::handle:vertical {{
-                background: rgb(180, 180, 180);
-                min-height: 20px;
-                border-radius: 2px;
-            }}
-            QScrollBar::handle:vertical:hover {{
-                background: rgb(150, 150, 150);
-            }}
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
-                height: 0px;
-            }}
-            QScrollBar:horizontal {{
-                background: rgb(240, 240, 240);
-                height: 8px;
-                border: none;
-            }}
-            QScrollBar::handle:horizontal {{
-                background: rgb(180, 180, 180);
-                min-width: 20px;
-                border-radius: 2px;
-            }}
-            QScrollBar::handle:horizontal:hover {{
-                background: rgb(150, 150, 150);
-            }}
-            QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {{
-                width: 0px;
-            }}
-        """)
+        # Configure tree view appearance; colors and item sizing come from the
+        # explorer stylesheet (ocr_app.ui.styles), which targets this object name
+        self.tree_view.setObjectName("fileExplorerTree")
+        self.tree_view.setFont(explorer_font())
         # Set smaller icon size
         self.tree_view.setIconSize(QSize(12, 12))
         self.tree_view.setAnimated(True)
         self.tree_view.setIndentation(12)
-        self.tree_view.setSortingEnabled(True)
-        self.tree_view.sortByColumn(0, Qt.AscendingOrder)
+        # Sorting is enabled in set_root_path() once a directory is shown, so the
+        # model is not re-sorted on every fetch while it is still being populated
 
         # Hide header bar completely
         self.tree_view.setHeaderHidden(True)
-        self.tree_view.hideColumn(1)  # Size
-        self.tree_view.hideColumn(2)  # Type
-        self.tree_view.hideColumn(3)  # Date modified
 
         # Single selection mode
         self.tree_view.setSelectionMode(QTreeView.SingleSelection)
@@ -144,26 +111,58 @@ class FileExplorerWidget(QWidget):
 
     def on_item_clicked(self, index):
         """Handle item click - emit signal only for files (not directories)"""
-        file_path = self.file_model.filePath(index)
-
-        # Only emit signal for image files, not directories
-        if os.path.isfile(file_path):
-            self.current_directory = os.path.dirname(file_path)
+        index = self.proxy_model.mapToSource(index)
+        # Only emit signal for image files, not directories (isDir uses the model's cached info)
+        if not self.file_model.isDir(index):
+            file_path = self.file_model.filePath(index)
+            self.current_directory = self.file_model.filePath(index.parent())
             self.file_selected.emit(file_path)
 
     def set_root_path(self, path):
         """Navigate to and expand the given path in the explorer"""
-        if os.path.exists(path):
-            # If path is a file, use its directory
-            if os.path.isfile(path):
-                path = os.path.dirname(path)
-            self.current_directory = path
-
-            # Expand to and scroll to the directory instead of restricting view
-            index = self.file_model.index(path)
-            self.tree_view.expand(index)
-            self.tree_view.scrollTo(index)
-            self.tree_view.setCurrentIndex(index)
+        source_index = self.file_model.index(path)
+        if not source_index.isValid():
+            # Missing, or hidden by the model's filters (e.g. dot-directories): nothing
+            # to show in the tree, but still remember an existing directory
+            directory = path if os.path.isdir(path) else os.path.dirname(path)
+            if os.path.isdir(directory):
+                self.current_directory = directory
+            return
+
+        # If path is a file, use its directory
+        if not self.file_model.isDir(source_index):
+            source_index = source_index.parent()
+        path = self.file_model.filePath(source_index)
+        self.current_directory = path
+
+        # Expand to and scroll to the directory instead of restricting view.
+        # Check before expanding: expand() triggers the fetch and clears canFetchMore()
+        still_loading = self.file_model.canFetchMore(source_index)
+
+        index = self.proxy_model.mapFromSource(source_index)
+        self.tree_view.expand(index)
+        if not self.tree_view.isSortingEnabled():
+            self.tree_view.setSortingEnabled(True)
+            self.tree_view.sortByColumn(0, Qt.AscendingOrder)
+
+        if still_loading:
+            # QFileSystemModel loads on its own thread; scrolling now would force a
+            # synchronous layout of a half-populated tree, so wait for directoryLoaded
+            self._pending_scroll_path = path
+        else:
+            self._pending_scroll_path = None
+            self._scroll_to(index)
+
+    def _on_directory_loaded(self, path):
+        """Scroll to the pending directory once QFileSystemModel has finished loading it"""
+        if path == self._pending_scroll_path:
+            self._pending_scroll_path = None
+            self._scroll_to(self.proxy_model.mapFromSource(self.file_model.index(path)))
+
+    def _scroll_to(self, index):
+        """Scroll to and select the given (proxy) index"""
+        self.tree_view.scrollTo(index)
+        self.tree_view.setCurrentIndex(index)
 
     def get_current_directory(self):
         """Return current directory path for use by file dialog"""
@@ -173,7 +172,18 @@ class FileExplorerWidget(QWidget):
         """Load last used directory from QSettings"""
         self.settings = settings
         saved_dir = settings.value('ui/explorer_last_directory', QDir.homePath())
-        self.set_root_path(saved_dir)
+        self.current_directory = saved_dir
+
+        # A stat on a slow or network directory can block, so check it on the pool
+        # and navigate when the result arrives instead of stalling window construction
+        QThreadPool.globalInstance().start(lambda: self._check_restore_directory(saved_dir))
+
+    def _check_restore_directory(self, path):
+        """Verify the saved directory (runs on a pool thread) and hand the result to the UI thread"""
+        # Fall back to home so the tree always gets a directory (and sorting) on startup
+        if not os.path.isdir(path):
+            path = QDir.homePath()
+        self.restore_directory_checked.emit(path)
 
     def save_current_directory(self, settings):
         """Save current directory to QSettings for persistence"""
@@ -1,10 +1,20 @@
 """Mixins for ImageWithBoxes widget - zoom/pan, selection, and rendering"""
-from PySide6.QtCore import Qt, QRect, QPoint, Signal
-from PySide6.QtGui import QPainter, QPen, QColor, QFont
+import math
+from functools import lru_cache
+
+from PySide6.QtCore import Qt, QRect, QPoint, QSize, Signal, QTimer, QThreadPool
+from PySide6.QtGui import QPainter, QPen, QBrush, QColor, QFont, QPixmap, QPixmapCache, QRegion
+
+
+def _smooth_scale_image(image, source_rect, width, height):
+    """Smoothly scale source_rect of a QImage (runs on a worker thread; QPixmap is GUI-thread only)"""
+    if source_rect != image.rect():
+        image = image.copy(source_rect)
+    return image.scaled(width, height, Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
 
 
 class ZoomPanMixin:
-    """Mixin for zoom and pan functionality"""
+    """Mixin for zoom and pan functionality (host must define a smooth_image_ready signal)"""
 
     def __init_zoom_pan__(self):
         """Initialize zoom/pan properties"""
@@ -20,6 +30,27 @@ class ZoomPanMixin:
         self.pan_start_offset_x = 0
         self.pan_start_offset_y = 0
 
+        # At high zoom only the part of the image around the viewport is scaled.
+        # scaled_pixmap covers _pixmap_source_rect (original coords) and is drawn
+        # _pixmap_origin display pixels from the image's top-left corner.
+        self._pixmap_source_rect = None
+        self._pixmap_origin = (0, 0)
+        # (pixmap cache key, source rect, target width, target height) of scaled_pixmap
+        self._display_key = None
+
+        # Smooth scaling is expensive on large scans: show a fast preview while the user
+        # is zooming/resizing and replace it with a smooth version once they pause
+        self._smooth_timer = QTimer(self)
+        self._smooth_timer.setSingleShot(True)
+        self._smooth_timer.setInterval(80)
+        self._smooth_timer.timeout.connect(self._apply_smooth_scaling)
+        # The smooth pass runs on the thread pool and is delivered back via the host
+        # widget's smooth_image_ready(object, object) signal, which this mixin requires
+        self._source_image = None  # (pixmap cache key, QImage copy of original_pixmap)
+        self.smooth_image_ready.connect(self._on_smooth_image_ready)
+        # Smoothly scaled results are kept in Qt's global QPixmapCache (sized in main()),
+        # so zooming back to a recent level reuses them
+
     def zoom_in(self):
         """Zoom in by 20%"""
         if hasattr(self, 'original_pixmap') and self.original_pixmap:
@@ -47,33 +78,114 @@ class ZoomPanMixin:
     def update_display(self):
         """Update the scaled pixmap and display"""
         if hasattr(self, 'original_pixmap') and self.original_pixmap:
-            # Scale image to fit while maintaining aspect ratio, then apply zoom
-            base_scaled = self.original_pixmap.scaled(
-                self.size(),
-                Qt.KeepAspectRatio,
-                Qt.SmoothTransformation
-            )
-
-            # Apply zoom level
-            zoomed_width = int(base_scaled.width() * self.zoom_level)
-            zoomed_height = int(base_scaled.height() * self.zoom_level)
-
-            self.scaled_pixmap = self.original_pixmap.scaled(
-                zoomed_width,
-                zoomed_height,
-                Qt.KeepAspectRatio,
-                Qt.SmoothTransformation
-            )
+            # Fit to the widget while maintaining aspect ratio (same size math as
+            # QPixmap.scaled), then apply zoom - computed without scaling the image
+            fitted = self.original_pixmap.size().scaled(self.size(), Qt.KeepAspectRatio)
+            zoomed_width = max(1, int(fitted.width() * self.zoom_level))
+            zoomed_height = max(1, int(fitted.height() * self.zoom_level))
+            full_size = self.original_pixmap.size().scaled(zoomed_width, zoomed_height, Qt.KeepAspectRatio)
 
             # Calculate scale factor and offset for centering
-            self.scale_factor = self.scaled_pixmap.width() / self.original_pixmap.width()
-            self.offset_x = (self.width() - self.scaled_pixmap.width()) // 2
-            self.offset_y = (self.height() - self.scaled_pixmap.height()) // 2
+            self.scale_factor = full_size.width() / self.original_pixmap.width()
+            self.offset_x = (self.width() - full_size.width()) // 2
+            self.offset_y = (self.height() - full_size.height()) // 2
+            self._full_scaled_size = full_size
+            self._handles_dirty = True  # Selection handles are in display coords
+
+            self.refresh_scaled_pixmap()
 
             if hasattr(self, 'zoom_changed'):
                 self.zoom_changed.emit(self.zoom_level)
             self.update()
 
+    def visible_source_rect(self, margin=0.5):
+        """Widget area in original image coords, padded by `margin` viewports per side"""
+        sf = self.scale_factor
+        pad_x = self.width() / sf * margin
+        pad_y = self.height() / sf * margin
+        left = (-self.offset_x - self.pan_offset_x) / sf - pad_x
+        top = (-self.offset_y - self.pan_offset_y) / sf - pad_y
+        right = (self.width() - self.offset_x - self.pan_offset_x) / sf + pad_x
+        bottom = (self.height() - self.offset_y - self.pan_offset_y) / sf + pad_y
+
+        visible = QRect(QPoint(math.floor(left), math.floor(top)),
+                        QPoint(math.ceil(right), math.ceil(bottom)))
+        return visible.intersected(self.original_pixmap.rect())
+
+    def refresh_scaled_pixmap(self):
+        """Rescale the part of the image needed for the current zoom/pan (fast preview)"""
+        source_rect = self.visible_source_rect()
+        if source_rect == self.original_pixmap.rect():
+            target_size = self._full_scaled_size
+        else:
+            # Memory stays proportional to the viewport instead of image size x zoom^2
+            target_size = QSize(max(1, round(source_rect.width() * self.scale_factor)),
+                                max(1, round(source_rect.height() * self.scale_factor)))
+
+        # Only rescale when the image, the covered region, or the target size changed
+        display_key = (self.original_pixmap.cacheKey(), source_rect.getRect(),
+                       target_size.width(), target_size.height())
+        if display_key != self._display_key or not self.scaled_pixmap:
+            self._pixmap_source_rect = source_rect
+            self._pixmap_origin = (round(source_rect.x() * self.scale_factor),
+                                   round(source_rect.y() * self.scale_factor))
+            self._display_key = display_key
+
+            cached = QPixmap()
+            if QPixmapCache.find(self._smooth_cache_key(), cached):
+                self.scaled_pixmap = cached
+                self._smooth_timer.stop()
+            else:
+                self.scaled_pixmap = self._scale_source(Qt.FastTransformation)
+                self._smooth_timer.start()  # Restarts the idle delay on every step
+
+    def _smooth_cache_key(self):
+        """QPixmapCache key for the smooth scaling of the current image region and size"""
+        pixmap_key, (x, y, w, h), target_width, target_height = self._display_key
+        return f"lifttext:{pixmap_key}:{x},{y},{w},{h}:{target_width}x{target_height}"
+
+    def _scale_source(self, transformation):
+        """Scale _pixmap_source_rect of the original image to the current target size"""
+        if self._pixmap_source_rect.isEmpty():
+            return QPixmap()  # Panned completely out of view
+
+        _, _, target_width, target_height = self._display_key or (None, None, 0, 0)
+        source = self.original_pixmap
+        if self._pixmap_source_rect != source.rect():
+            source = source.copy(self._pixmap_source_rect)
+        return source.scaled(target_width, target_height, Qt.IgnoreAspectRatio, transformation)
+
+    def _apply_smooth_scaling(self):
+        """Replace the fast preview pixmap with a smoothly scaled one"""
+        if not self.original_pixmap or self._display_key is None:
+            return
+
+        if self._pixmap_source_rect.isEmpty():
+            return  # Panned completely out of view
+
+        # Scale a QImage on the thread pool so large scans don't block the UI;
+        # the display key tags the result so stale ones are dropped on arrival
+        pixmap_key = self.original_pixmap.cacheKey()
+        if self._source_image is None or self._source_image[0] != pixmap_key:
+            self._source_image = (pixmap_key, self.original_pixmap.toImage())
+        image = self._source_image[1]
+        display_key = self._display_key
+        source_rect = QRect(self._pixmap_source_rect)
+        _, _, target_width, target_height = display_key
+        ready = self.smooth_image_ready
+        QThreadPool.globalInstance().start(
+            lambda: ready.emit(display_key, _smooth_scale_image(image, source_rect, target_width, target_height))
+        )
+
+    def _on_smooth_image_ready(self, display_key, image):
+        """Show a smoothly scaled image from the thread pool if it still matches the display"""
+        if display_key != self._display_key:
+            return  # Zoom, pan or image changed while it was scaling
+
+        self.scaled_pixmap = QPixmap.fromImage(image)
+        QPixmapCache.insert(self._smooth_cache_key(), self.scaled_pixmap)
+        self.update()
+
     def handle_pan_press(self, event):
         """Handle pan button press (middle/right mouse)"""
         if event.button() in (Qt.MiddleButton, Qt.RightButton):
@@ -101,32 +213,65 @@ class ZoomPanMixin:
             delta_x = current_pos.x() - self.pan_start_pos.x()
             delta_y = current_pos.y() - self.pan_start_pos.y()
 
-            self.pan_offset_x = self.pan_start_offset_x + delta_x
-            self.pan_offset_y = self.pan_start_offset_y + delta_y
-
-            self.update()
+            new_offset_x = self.pan_start_offset_x + delta_x
+            new_offset_y = self.pan_start_offset_y + delta_y
+            scroll_x = new_offset_x - self.pan_offset_x
+            scroll_y = new_offset_y - self.pan_offset_y
+            self.pan_offset_x = new_offset_x
+            self.pan_offset_y = new_offset_y
+            self._handles_dirty = True  # Selection handles are in display coords
+
+            # Rescale only when the viewport leaves the region already scaled
+            if (self.original_pixmap and self._pixmap_source_rect is not None
+                    and not self._pixmap_source_rect.contains(self.visible_source_rect(margin=0))):
+                self.refresh_scaled_pixmap()
+
+            # Everything drawn moves with the image, so shift the painted pixels and
+            # let Qt repaint only the newly exposed strips. Without an image only the
+            # centered placeholder is painted, which must not move.
+            if (scroll_x or scroll_y) and self.scaled_pixmap:
+                self.scroll(scroll_x, scroll_y)
             return True
         return False
 
 
+# Which selection edges each resize handle moves: (left, top, right, bottom)
+# Handles: 0=TL, 1=T, 2=TR, 3=R, 4=BR, 5=B, 6=BL, 7=L
+_HANDLE_EDGES = (
+    (True, True, False, False),    # 0: Top-left
+    (False, True, False, False),   # 1: Top
+    (False, True, True, False),    # 2: Top-right
+    (False, False, True, False),   # 3: Right
+    (False, False, True, True),    # 4: Bottom-right
+    (False, False, False, True),   # 5: Bottom
+    (True, False, False, True),    # 6: Bottom-left
+    (True, False, False, False),   # 7: Left
+)
+
+
 class SelectionMixin:
     """Mixin for selection rectangle functionality"""
 
+    # Selection state defaults live on the class; instances only get their own
+    # attributes once the user actually starts selecting
+    selection_rect_original = None  # (x, y, w, h) in ORIGINAL image coords (not display coords)
+    selection_handles = ()  # Handle rects in display coords (reassigned, never mutated in place)
+    _handles_dirty = True  # selection_handles must be rebuilt (selection, zoom or pan changed)
+
+    # Interaction state
+    drawing_selection = False  # Currently drawing new selection
+    dragging_handle = None  # Which handle is being dragged (0-7 or None)
+    moving_selection = False  # Currently moving entire selection
+    drag_start_pos = None  # QPoint where drag started (display coords)
+    drag_start_rect = None  # Original rect when drag started (original coords)
+    press_selection_rect = None  # selection_rect_original when the mouse was pressed
+
+    # Minimum selection size (prevent too-small selections)
+    MIN_SELECTION_SIZE = 20  # pixels in original image space
+
     def __init_selection__(self):
         """Initialize selection properties"""
         self.selection_mode = False  # Whether selection mode is active
-        self.selection_rect_original = None  # (x, y, w, h) in ORIGINAL image coords (not display coords)
-        self.selection_handles = []  # List of handle rects in display coords (recalculated on paint)
-
-        # Interaction state
-        self.drawing_selection = False  # Currently drawing new selection
-        self.dragging_handle = None  # Which handle is being dragged (0-7 or None)
-        self.moving_selection = False  # Currently moving entire selection
-        self.drag_start_pos = None  # QPoint where drag started (display coords)
-        self.drag_start_rect = None  # Original rect when drag started (original coords)
-
-        # Minimum selection size (prevent too-small selections)
-        self.MIN_SELECTION_SIZE = 20  # pixels in original image space
 
     # Coordinate conversion methods
     def display_to_original_coords(self, display_x, display_y):
@@ -144,6 +289,26 @@ class SelectionMixin:
         display_y = int(orig_y * self.scale_factor + self.offset_y + self.pan_offset_y)
         return (display_x, display_y)
 
+    def selection_repaint_rect(self):
+        """Display area covered by the selection border, handles and labels (None if no selection)"""
+        rect = self.get_selection_display_rect()
+        if rect is None:
+            return None
+        # Handles and border straddle the edge; the "too small" warning is drawn
+        # centered up to 30px below the rect and can be wider than it
+        return rect.normalized().adjusted(-60, -10, 60, 40)
+
+    def update_selection_area(self, old_rect):
+        """Repaint only where the selection changed, given selection_repaint_rect() from before"""
+        new_rect = self.selection_repaint_rect()
+        if old_rect == new_rect:
+            return  # Mouse moved less than one original-image pixel
+        if old_rect is None or new_rect is None:
+            # The dark overlay covering the rest of the widget appears or disappears
+            self.update()
+        else:
+            self.update(old_rect.united(new_rect))
+
     def get_selection_display_rect(self):
         """Get selection rectangle in display coordinates (recalculated from original coords)"""
         if not self.selection_rect_original:
@@ -171,7 +336,8 @@ class SelectionMixin:
     def clear_selection(self):
         """Clear current selection"""
         self.selection_rect_original = None
-        self.selection_handles = []
+        self.selection_handles = ()
+        self._handles_dirty = True
         self.update()
 
     # Selection validation methods
@@ -191,6 +357,7 @@ class SelectionMixin:
         h = min(h, img_h - y)
 
         self.selection_rect_original = (x, y, max(1, w), max(1, h))
+        self._handles_dirty = True
 
     def validate_selection(self):
         """Check if selection meets minimum size requirements"""
@@ -203,13 +370,10 @@ class SelectionMixin:
     # Handle management methods
     def update_selection_handles(self):
         """Update resize handle positions (8 handles: corners + midpoints)"""
-        self.selection_handles = []
-
-        if not self.selection_rect_original:
-            return
-
+        self._handles_dirty = False
         rect = self.get_selection_display_rect()
         if not rect:
+            self.selection_handles = ()
             return
 
         handle_size = 10
@@ -227,11 +391,12 @@ class SelectionMixin:
             (rect.left(), rect.center().y()),    # 7: Left
         ]
 
-        for x, y in positions:
-            self.selection_handles.append(QRect(x - half, y - half, handle_size, handle_size))
+        self.selection_handles = [QRect(x - half, y - half, handle_size, handle_size) for x, y in positions]
 
     def find_handle_at_pos(self, pos):
         """Find which handle (if any) is at the given position. Returns handle index (0-7) or None"""
+        if self._handles_dirty:
+            self.update_selection_handles()
         for idx, handle_rect in enumerate(self.selection_handles):
             if handle_rect.contains(pos):
                 return idx
@@ -262,7 +427,7 @@ class SelectionMixin:
         h = abs(y2 - y1)
 
         self.selection_rect_original = (x, y, w, h)
-        self.update_selection_handles()
+        self._handles_dirty = True
 
     def move_selection(self, current_pos):
         """Move the entire selection rectangle"""
@@ -279,7 +444,7 @@ class SelectionMixin:
 
         x, y, w, h = self.drag_start_rect
         self.selection_rect_original = (int(x + delta_orig_x), int(y + delta_orig_y), w, h)
-        self.update_selection_handles()
+        self._handles_dirty = True
 
     def resize_selection_with_handle(self, current_pos):
         """Resize selection by dragging a handle"""
@@ -290,20 +455,16 @@ class SelectionMixin:
         curr_orig = self.display_to_original_coords(current_pos.x(), current_pos.y())
         x, y, w, h = self.drag_start_rect
 
-        # Adjust rectangle based on which handle is being dragged
-        # Handles: 0=TL, 1=T, 2=TR, 3=R, 4=BR, 5=B, 6=BL, 7=L
-        if self.dragging_handle in [0, 6, 7]:  # Left side
-            new_x = curr_orig[0]
-            new_w = (x + w) - new_x
-            x, w = new_x, new_w
-        elif self.dragging_handle in [2, 3, 4]:  # Right side
+        # Move the edges of the dragged handle, keeping the opposite edges fixed
+        move_left, move_top, move_right, move_bottom = _HANDLE_EDGES[self.dragging_handle]
+        if move_left:
+            x, w = curr_orig[0], (x + w) - curr_orig[0]
+        elif move_right:
             w = curr_orig[0] - x
 
-        if self.dragging_handle in [0, 1, 2]:  # Top side
-            new_y = curr_orig[1]
-            new_h = (y + h) - new_y
-            y, h = new_y, new_h
-        elif self.dragging_handle in [4, 5, 6]:  # Bottom side
+        if move_top:
+            y, h = curr_orig[1], (y + h) - curr_orig[1]
+        elif move_bottom:
             h = curr_orig[1] - y
 
         # Normalize (handle negative dimensions)
@@ -313,7 +474,7 @@ class SelectionMixin:
             y, h = y + h, abs(h)
 
         self.selection_rect_original = (int(x), int(y), int(w), int(h))
-        self.update_selection_handles()
+        self._handles_dirty = True
 
     def update_cursor(self):
         """Update cursor based on current state and mouse position"""
@@ -342,129 +503,137 @@ class SelectionMixin:
             self.setCursor(Qt.ArrowCursor)
 
 
+def _cosmetic_pen(color, width):
+    """Pen whose width stays in screen pixels under the painter's zoom transform"""
+    pen = QPen(color, width)
+    pen.setCosmetic(True)
+    return pen
+
+
+# Paint resources shared by every paint (built once instead of per box / per frame)
+_BOX_SELECTED = (_cosmetic_pen(QColor(25, 118, 210), 3), QBrush(QColor(187, 222, 251, 100)))  # Blue
+_BOX_HOVERED = (_cosmetic_pen(QColor(33, 150, 243), 2), QBrush(QColor(227, 242, 253, 80)))  # Lighter blue
+_BOX_NORMAL = (_cosmetic_pen(QColor(76, 175, 80), 2), QBrush(QColor(76, 175, 80, 50)))  # Green
+
+_PLACEHOLDER_COLOR = QColor(150, 150, 150)
+_OVERLAY_COLOR = QColor(0, 0, 0, 120)  # Dark overlay
+_LABEL_BACKGROUND = QColor(0, 0, 0, 150)
+_LABEL_COLOR = QColor(255, 255, 255)
+_WARNING_COLOR = QColor(255, 0, 0)
+_HANDLE_BRUSH = QBrush(QColor(255, 165, 0))  # Orange handles
+_BORDER_VALID = QPen(QColor(255, 165, 0), 3, Qt.SolidLine)  # Orange for valid selection
+_BORDER_INVALID = QPen(QColor(255, 0, 0), 3, Qt.DashLine)  # Red for invalid selection
+
+
+@lru_cache(maxsize=None)
+def _font(point_size, bold=False):
+    """Return a shared Arial font (created on first paint, after the QApplication exists)"""
+    return QFont("Arial", point_size, QFont.Bold if bold else QFont.Normal)
+
+
 class RenderingMixin:
     """Mixin for rendering image, bounding boxes, and selection overlay"""
 
-    def render_image_and_boxes(self, painter):
-        """Render the scaled image and word boxes"""
+    def render_image_and_boxes(self, painter, dirty_rect=None):
+        """Render the scaled image and word boxes (only boxes touching dirty_rect, if given)"""
         if not hasattr(self, 'scaled_pixmap') or not self.scaled_pixmap:
             # Draw centered placeholder text when no image is loaded
             if hasattr(self, 'text') and self.text():
-                painter.setPen(QColor(150, 150, 150))
-                painter.setFont(QFont("Arial", 14))
+                painter.setPen(_PLACEHOLDER_COLOR)
+                painter.setFont(_font(14))
                 painter.drawText(self.rect(), Qt.AlignCenter, self.text())
             return
 
-        # Draw the scaled image centered with pan offset
-        draw_x = self.offset_x + self.pan_offset_x
-        draw_y = self.offset_y + self.pan_offset_y
-        painter.drawPixmap(draw_x, draw_y, self.scaled_pixmap)
-
-        # Draw word boxes
-        if hasattr(self, 'word_data'):
-            for idx, word_info in enumerate(self.word_data):
-                if 'bbox' in word_info and word_info['bbox']:
-                    bbox = word_info['bbox']
-
-                    # Convert bbox coordinates to scaled display coordinates with pan offset
-                    scaled_points = []
-                    for point in bbox:
-                        x = int(point[0] * self.scale_factor + self.offset_x + self.pan_offset_x)
-                        y = int(point[1] * self.scale_factor + self.offset_y + self.pan_offset_y)
-                        scaled_points.append(QPoint(x, y))
-
-                    # Determine box color based on state
-                    if hasattr(self, 'selected_word_index') and idx == self.selected_word_index:
-                        pen_color = QColor(25, 118, 210)  # Blue for selected
-                        fill_color = QColor(187, 222, 251, 100)  # Light blue fill
-                        pen_width = 3
-                    elif hasattr(self, 'hovered_word_index') and idx == self.hovered_word_index:
-                        pen_color = QColor(33, 150, 243)  # Lighter blue for hover
-                        fill_color = QColor(227, 242, 253, 80)  # Very light blue fill
-                        pen_width = 2
-                    else:
-                        pen_color = QColor(76, 175, 80)  # Green for normal
-                        fill_color = QColor(76, 175, 80, 50)  # Light green fill
-                        pen_width = 2
-
-                    # Draw filled polygon
-                    painter.setPen(Qt.NoPen)
-                    painter.setBrush(fill_color)
-                    painter.drawPolygon(scaled_points)
-
-                    # Draw border
-                    pen = QPen(pen_color, pen_width)
-                    painter.setPen(pen)
-                    painter.setBrush(Qt.NoBrush)
-                    painter.drawPolygon(scaled_points)
+        # Work in image coordinates: one translation replaces adding offset + pan per vertex
+        painter.save()
+        painter.translate(self.offset_x + self.pan_offset_x, self.offset_y + self.pan_offset_y)
+
+        # Draw the scaled image (it may cover only the region around the viewport)
+        painter.drawPixmap(self._pixmap_origin[0], self._pixmap_origin[1], self.scaled_pixmap)
+
+        # Draw word boxes directly in original image coords; the painter applies the zoom
+        if hasattr(self, 'word_index'):
+            # Cull boxes outside the repainted area, mapped to original coords and
+            # padded for the border pen (3px at most)
+            area = dirty_rect if dirty_rect is not None else self.rect()
+            pad = 3
+            left, top = self.display_to_original_coords(area.left() - pad, area.top() - pad)
+            right, bottom = self.display_to_original_coords(area.right() + pad + 1, area.bottom() + pad + 1)
+            visible = self.word_index.indices_in_rect(left - 1, top - 1, right + 1, bottom + 1)
+
+            painter.scale(self.scale_factor, self.scale_factor)
+            for idx in visible:
+                polygon = self.word_index.polygons[idx]
+                # Determine box style based on state
+                if hasattr(self, 'selected_word_index') and idx == self.selected_word_index:
+                    pen, fill = _BOX_SELECTED
+                elif hasattr(self, 'hovered_word_index') and idx == self.hovered_word_index:
+                    pen, fill = _BOX_HOVERED
+                else:
+                    pen, fill = _BOX_NORMAL
+
+                # Draw filled polygon
+                painter.setPen(Qt.NoPen)
+                painter.setBrush(fill)
+                painter.drawPolygon(polygon)
+
+                # Draw border (cosmetic pen: width in screen pixels regardless of zoom)
+                painter.setPen(pen)
+                painter.setBrush(Qt.NoBrush)
+                painter.drawPolygon(polygon)
+
+        painter.restore()
 
     def render_selection_overlay(self, painter):
         """Render selection rectangle and overlay"""
-        if not hasattr(self, 'selection_rect_original') or not self.selection_rect_original:
+        # Selections only exist in selection mode (leaving it clears them)
+        if not self.selection_mode or not self.selection_rect_original:
             return
 
         display_rect = self.get_selection_display_rect()
         if not display_rect:
             return
 
-        # 1. Draw semi-transparent overlay on non-selected area
-        overlay_color = QColor(0, 0, 0, 120)  # Dark overlay
-
-        painter.setPen(Qt.NoPen)
-        painter.setBrush(overlay_color)
-
-        # Draw overlay in 4 rectangles around selection
-        # Top
-        painter.drawRect(QRect(0, 0, self.width(), display_rect.top()))
-        # Bottom
-        painter.drawRect(QRect(0, display_rect.bottom(), self.width(), self.height() - display_rect.bottom()))
-        # Left
-        painter.drawRect(QRect(0, display_rect.top(), display_rect.left(), display_rect.height()))
-        # Right
-        painter.drawRect(QRect(display_rect.right(), display_rect.top(), self.width() - display_rect.right(), display_rect.height()))
+        # 1. Draw semi-transparent overlay on non-selected area, as one fill
+        # clipped to everything outside the selection
+        painter.save()
+        painter.setClipRegion(QRegion(self.rect()).subtracted(QRegion(display_rect)))
+        painter.fillRect(self.rect(), _OVERLAY_COLOR)
+        painter.restore()
 
         # 2. Draw selection rectangle border
         is_valid = self.validate_selection()
 
-        if is_valid:
-            border_color = QColor(255, 165, 0)  # Orange for valid selection
-            border_style = Qt.SolidLine
-        else:
-            border_color = QColor(255, 0, 0)  # Red for invalid selection
-            border_style = Qt.DashLine
-
-        pen = QPen(border_color, 3, border_style)
-        painter.setPen(pen)
+        painter.setPen(_BORDER_VALID if is_valid else _BORDER_INVALID)
         painter.setBrush(Qt.NoBrush)
         painter.drawRect(display_rect)
 
-        # 3. Draw resize handles (8 handles: corners + midpoints)
-        self.update_selection_handles()
+        # 3. Draw resize handles (8 handles: corners + midpoints), rebuilt only when stale
+        if self._handles_dirty:
+            self.update_selection_handles()
 
         painter.setPen(Qt.NoPen)
-        painter.setBrush(QColor(255, 165, 0))  # Orange handles
-
-        for handle_rect in self.selection_handles:
-            painter.drawRect(handle_rect)
+        painter.setBrush(_HANDLE_BRUSH)
+        painter.drawRects(self.selection_handles)
 
         # 4. Draw size label inside selection (if large enough)
         if display_rect.width() > 60 and display_rect.height() > 30:
             x, y, w, h = self.selection_rect_original
             size_text = f"{w} x {h}"
 
-            painter.setPen(QColor(255, 255, 255))
-            painter.setFont(QFont("Arial", 12, QFont.Bold))
+            painter.setPen(_LABEL_COLOR)
+            painter.setFont(_font(12, bold=True))
             text_rect = QRect(display_rect.left() + 5, display_rect.top() + 5,
                             display_rect.width() - 10, 25)
 
             # Draw semi-transparent background for text
-            painter.fillRect(text_rect, QColor(0, 0, 0, 150))
+            painter.fillRect(text_rect, _LABEL_BACKGROUND)
             painter.drawText(text_rect, Qt.AlignCenter, size_text)
 
         # 5. Draw "too small" warning if invalid
         if not is_valid:
             warning_text = f"Min: {self.MIN_SELECTION_SIZE}px"
-            painter.setPen(QColor(255, 0, 0))
-            painter.setFont(QFont("Arial", 14, QFont.Bold))
+            painter.setPen(_WARNING_COLOR)
+            painter.setFont(_font(14, bold=True))
             text_rect = display_rect.adjusted(0, 0, 0, 30)
             painter.drawText(text_rect, Qt.AlignCenter, warning_text)
@@ -1,9 +1,10 @@
 """Image viewer widget with interactive word boxes using mixin composition"""
 from PySide6.QtWidgets import QLabel
-from PySide6.QtCore import Qt, Signal, QPoint
+from PySide6.QtCore import Qt, Signal, QTimer
 from PySide6.QtGui import QPainter
 
 from .image_mixins import ZoomPanMixin, SelectionMixin, RenderingMixin
+from .word_box_index import WordBoxIndex
 
 
 class ImageWithBoxes(QLabel, ZoomPanMixin, SelectionMixin, RenderingMixin):
@@ -11,6 +12,7 @@ class ImageWithBoxes(QLabel, ZoomPanMixin, SelectionMixin, RenderingMixin):
     word_clicked = Signal(object)  # Emits word data when a box is clicked (dict or None)
     zoom_changed = Signal(float)  # Emits current zoom level
     selection_changed = Signal(bool)  # Emits when selection becomes active/inactive
+    smooth_image_ready = Signal(object, object)  # (display key, QImage) from the smooth-scaling worker
 
     def __init__(self):
         QLabel.__init__(self)
@@ -19,6 +21,7 @@ class ImageWithBoxes(QLabel, ZoomPanMixin, SelectionMixin, RenderingMixin):
         self.original_pixmap = None
         self.scaled_pixmap = None
         self.word_data = []
+        self.word_index = WordBoxIndex([])  # Spatial index over word_data for hit-testing
         self.selected_word_index = None
         self.scale_factor = 1.0
         self.offset_x = 0
@@ -29,13 +32,25 @@ class ImageWithBoxes(QLabel, ZoomPanMixin, SelectionMixin, RenderingMixin):
         self.__init_zoom_pan__()
         self.__init_selection__()
 
+        # Hover hit-tests run at most once per frame; mouse moves in between only
+        # record the latest position
+        self._pending_hover_pos = None
+        self._hover_timer = QTimer(self)
+        self._hover_timer.setSingleShot(True)
+        self._hover_timer.setInterval(16)
+        self._hover_timer.timeout.connect(self._do_hover_scan)
+
         # Configure widget
         self.setMouseTracking(True)
+        # paintEvent fills its own background, so Qt can skip erasing it and
+        # scroll() can blit the existing pixels when panning
+        self.setAttribute(Qt.WA_OpaquePaintEvent)
 
     def set_image(self, pixmap):
         """Set the image to display"""
         self.original_pixmap = pixmap
         self.word_data = []
+        self.word_index = WordBoxIndex([])
         self.selected_word_index = None
         self.hovered_word_index = None
         self.zoom_level = 1.0  # Reset zoom when loading new image
@@ -47,6 +62,7 @@ class ImageWithBoxes(QLabel, ZoomPanMixin, SelectionMixin, RenderingMixin):
     def set_word_data(self, words):
         """Set word bounding box data"""
         self.word_data = words
+        self.word_index = WordBoxIndex(words)
         self.update()
 
     def resizeEvent(self, event):
@@ -59,8 +75,11 @@ class ImageWithBoxes(QLabel, ZoomPanMixin, SelectionMixin, RenderingMixin):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
 
+        # Opaque widget: every repainted pixel must be drawn here
+        painter.fillRect(event.rect(), self.palette().brush(self.backgroundRole()))
+
         # Render image and word boxes (from RenderingMixin)
-        self.render_image_and_boxes(painter)
+        self.render_image_and_boxes(painter, event.rect())
 
         # Draw selection rectangle and overlay (from RenderingMixin)
         self.render_selection_overlay(painter)
@@ -75,6 +94,7 @@ class ImageWithBoxes(QLabel, ZoomPanMixin, SelectionMixin, RenderingMixin):
         # PRIORITY 2: Selection mode (left button)
         if self.selection_mode and event.button() == Qt.LeftButton:
             click_pos = event.pos()
+            self.press_selection_rect = self.selection_rect_original  # Compared on release
 
             # Check if clicking resize handle (in display coords)
             handle_idx = self.find_handle_at_pos(click_pos)
@@ -95,36 +115,19 @@ class ImageWithBoxes(QLabel, ZoomPanMixin, SelectionMixin, RenderingMixin):
             self.drawing_selection = True
             self.drag_start_pos = click_pos
             self.selection_rect_original = None
+            self.update()
             return
 
         # PRIORITY 3: Word box clicking (only if NOT in selection mode)
         if event.button() == Qt.LeftButton:
-            click_pos = event.pos()
-            word_found = False
-
-            # Check which word box was clicked (in reverse order for top-most)
-            for idx in range(len(self.word_data) - 1, -1, -1):
-                word_info = self.word_data[idx]
-                if 'bbox' in word_info and word_info['bbox']:
-                    bbox = word_info['bbox']
-
-                    # Convert bbox to scaled coordinates with pan offset
-                    scaled_points = []
-                    for point in bbox:
-                        x = int(point[0] * self.scale_factor + self.offset_x + self.pan_offset_x)
-                        y = int(point[1] * self.scale_factor + self.offset_y + self.pan_offset_y)
-                        scaled_points.append(QPoint(x, y))
-
-                    # Check if click is inside polygon
-                    if self.point_in_polygon(click_pos, scaled_points):
-                        self.selected_word_index = idx
-                        self.word_clicked.emit(word_info)
-                        self.update()
-                        word_found = True
-                        break
+            idx = self.word_index_at(event.pos())
+            if idx is not None:
+                self.selected_word_index = idx
+                self.word_clicked.emit(self.word_data[idx])
+                self.update()
 
             # If clicked on empty space, clear selection
-            if not word_found and self.selected_word_index is not None:
+            elif self.selected_word_index is not None:
                 self.selected_word_index = None
                 self.word_clicked.emit(None)  # Signal deselection
                 self.update()
@@ -142,9 +145,11 @@ class ImageWithBoxes(QLabel, ZoomPanMixin, SelectionMixin, RenderingMixin):
                 # Clamp and validate selection
                 self.clamp_selection_to_image()
 
-                # Emit signal only once on release (emit True if selection exists)
-                has_selection = self.selection_rect_original is not None
-                self.selection_changed.emit(has_selection)
+                # Emit signal only once on release, and only if the drag changed the
+                # selection (emit True if selection exists)
+                if self.selection_rect_original != self.press_selection_rect:
+                    has_selection = self.selection_rect_original is not None
+                    self.selection_changed.emit(has_selection)
 
                 # Reset interaction state
                 self.drawing_selection = False
@@ -165,24 +170,28 @@ class ImageWithBoxes(QLabel, ZoomPanMixin, SelectionMixin, RenderingMixin):
             return
 
         # Handle selection operations
+        # Selection drags repaint only the old and new selection areas
         if self.dragging_handle is not None:
             # Resize selection with constraints
+            old_rect = self.selection_repaint_rect()
             self.resize_selection_with_handle(event.pos())
             self.update_cursor()  # Change cursor based on handle
-            self.update()
+            self.update_selection_area(old_rect)
             return
 
         if self.moving_selection:
             # Move entire selection
+            old_rect = self.selection_repaint_rect()
             self.move_selection(event.pos())
             self.setCursor(Qt.SizeAllCursor)
-            self.update()
+            self.update_selection_area(old_rect)
             return
 
         if self.drawing_selection:
             # Expand selection from drag start
+            old_rect = self.selection_repaint_rect()
             self.update_selection_from_drag(event.pos())
-            self.update()
+            self.update_selection_area(old_rect)
             return
 
         # Handle hover feedback in selection mode
@@ -191,54 +200,36 @@ class ImageWithBoxes(QLabel, ZoomPanMixin, SelectionMixin, RenderingMixin):
             self.update_cursor()
             return
 
-        # Fall back to existing word box hover logic
-        # Handle word box hover
-        hover_pos = event.pos()
-        found_hover = False
-
-        # Check which word box is hovered (in reverse order for top-most)
-        for idx in range(len(self.word_data) - 1, -1, -1):
-            word_info = self.word_data[idx]
-            if 'bbox' in word_info and word_info['bbox']:
-                bbox = word_info['bbox']
-
-                # Convert bbox to scaled coordinates with pan offset
-                scaled_points = []
-                for point in bbox:
-                    x = int(point[0] * self.scale_factor + self.offset_x + self.pan_offset_x)
-                    y = int(point[1] * self.scale_factor + self.offset_y + self.pan_offset_y)
-                    scaled_points.append(QPoint(x, y))
-
-                # Check if hover is inside polygon
-                if self.point_in_polygon(hover_pos, scaled_points):
-                    if self.hovered_word_index != idx:
-                        self.hovered_word_index = idx
-                        self.setCursor(Qt.PointingHandCursor)
-                        self.update()
-                    found_hover = True
-                    break
-
-        if not found_hover and self.hovered_word_index is not None:
+        # Fall back to word box hover (coalesced; see _do_hover_scan)
+        self._pending_hover_pos = event.pos()
+        if not self._hover_timer.isActive():  # Don't restart, or constant motion would starve it
+            self._hover_timer.start()
+
+    def _do_hover_scan(self):
+        """Update the hovered word box for the latest mouse position"""
+        if self._pending_hover_pos is None or self.selection_mode:
+            return
+
+        idx = self.word_index_at(self._pending_hover_pos)
+        self._pending_hover_pos = None
+        if idx is not None:
+            if self.hovered_word_index != idx:
+                self.hovered_word_index = idx
+                self.setCursor(Qt.PointingHandCursor)
+                self.update()
+
+        elif self.hovered_word_index is not None:
             self.hovered_word_index = None
             self.setCursor(Qt.ArrowCursor)
             self.update()
 
-    def point_in_polygon(self, point, polygon):
-        """Check if a point is inside a polygon using ray casting algorithm"""
-        x, y = point.x(), point.y()
-        n = len(polygon)
-        inside = False
-
-        p1 = polygon[0]
-        for i in range(1, n + 1):
-            p2 = polygon[i % n]
-            if y > min(p1.y(), p2.y()):
-                if y <= max(p1.y(), p2.y()):
-                    if x <= max(p1.x(), p2.x()):
-                        if p1.y() != p2.y():
-                            xinters = (y - p1.y()) * (p2.x() - p1.x()) / (p2.y() - p1.y()) + p1.x()
-                        if p1.x() == p2.x() or x <= xinters:
-                            inside = not inside
-            p1 = p2
-
-        return inside
+    def word_index_at(self, pos):
+        """Return the index of the top-most word box under a display position, or None"""
+        if not self.original_pixmap or not self.word_data:
+            return None
+
+        # Convert the mouse position to original image coords once, instead of
+        # converting every bbox vertex to display coords
+        x = (pos.x() - self.offset_x - self.pan_offset_x) / self.scale_factor
+        y = (pos.y() - self.offset_y - self.pan_offset_y) / self.scale_factor
+        return self.word_index.hit_test(x, y)
@@ -0,0 +1,71 @@
+"""Uniform-grid spatial index for hit-testing OCR word boxes"""
+from collections import defaultdict
+
+import numpy as np
+from PySide6.QtCore import Qt, QPointF
+from PySide6.QtGui import QPolygonF
+
+
+class WordBoxIndex:
+    """Buckets word bounding boxes (original image coords) into grid cells.
+
+    A lookup only ray-casts the boxes whose cell contains the point, so hit-testing
+    stays O(1) expected instead of scanning every word on each mouse event.
+    """
+
+    def __init__(self, word_data):
+        self.polygons = {}  # word index -> QPolygonF (also drawn by RenderingMixin)
+        # Per-word bounding boxes as NumPy columns; NaN for words without a bbox,
+        # which makes every comparison False so they are always rejected
+        self.min_x, self.min_y, self.max_x, self.max_y = np.full((4, len(word_data)), np.nan)
+
+        for idx, word_info in enumerate(word_data):
+            bbox = word_info.get('bbox')
+            if not bbox:
+                continue
+            points = [(float(p[0]), float(p[1])) for p in bbox]
+            xs = [p[0] for p in points]
+            ys = [p[1] for p in points]
+            # QPolygonF.containsPoint runs the ray-cast in compiled code
+            self.polygons[idx] = QPolygonF([QPointF(x, y) for x, y in points])
+            self.min_x[idx], self.min_y[idx] = min(xs), min(ys)
+            self.max_x[idx], self.max_y[idx] = max(xs), max(ys)
+
+        # Cell size ~ median box width: a typical word spans one or two cells
+        widths = (self.max_x - self.min_x)[list(self.polygons)]
+        self.cell_size = max(float(np.median(widths)), 1.0) if len(widths) else 1.0
+
+        cells = defaultdict(list)
+        for idx in self.polygons:
+            for gx in range(self._cell(self.min_x[idx]), self._cell(self.max_x[idx]) + 1):
+                for gy in range(self._cell(self.min_y[idx]), self._cell(self.max_y[idx]) + 1):
+                    cells[(gx, gy)].append(idx)
+        # (gx, gy) -> word indices in insertion order
+        self.cells = {cell: np.array(indices, dtype=np.intp) for cell, indices in cells.items()}
+
+    def _cell(self, value):
+        """Grid cell coordinate for an original-image coordinate"""
+        return int(value // self.cell_size)
+
+    def hit_test(self, x, y):
+        """Return the index of the top-most word box containing (x, y), or None"""
+        candidates = self.cells.get((self._cell(x), self._cell(y)))
+        if candidates is None:
+            return None
+
+        # Reject by bounding box in one vectorized pass, then ray-cast the survivors
+        mask = ((self.min_x[candidates] <= x) & (x <= self.max_x[candidates]) &
+                (self.min_y[candidates] <= y) & (y <= self.max_y[candidates]))
+        point = QPointF(x, y)
+
+        # Later words are drawn on top, so check them first
+        for idx in candidates[mask][::-1]:
+            if self.polygons[idx].containsPoint(point, Qt.OddEvenFill):
+                return int(idx)
+        return None
+
+    def indices_in_rect(self, left, top, right, bottom):
+        """Return indices of word boxes whose bounding box overlaps the given rect, in word order"""
+        visible = ((self.max_x >= left) & (self.min_x <= right) &
+                   (self.max_y >= top) & (self.min_y <= bottom))
+        return np.nonzero(visible)[0].tolist()
@@ -1,24 +1,24 @@
 """Application constants and configuration"""
 
 # OCR Model Options
-DETECTION_MODELS = [
+DETECTION_MODELS = (
     'PP-OCRv4_mobile_det',
     'PP-OCRv4_server_det',
     'PP-OCRv5_mobile_det',
     'PP-OCRv5_server_det',
-]
+)
 
-RECOGNITION_MODELS = [
+RECOGNITION_MODELS = (
     'en_PP-OCRv4_mobile_rec',      # English (fast)
     'en_PP-OCRv5_mobile_rec',      # English (latest)
     'PP-OCRv4_mobile_rec',         # Chinese (fast)
     'PP-OCRv4_server_rec',         # Chinese (high accuracy)
     'PP-OCRv5_mobile_rec',         # Multi-language (latest, supports CN/EN/JP)
     'PP-OCRv5_server_rec',         # Multi-language (best accuracy)
-]
+)
 
 # Supported Languages (display_name, code)
-SUPPORTED_LANGUAGES = [
+SUPPORTED_LANGUAGES = (
     ('Chinese & English', 'ch'),
     ('English', 'en'),
     ('Chinese Traditional', 'ch_tra'),
@@ -39,10 +39,10 @@ SUPPORTED_LANGUAGES = [
     ('Polish', 'pl'),
     ('Dutch', 'nl'),
     ('Swedish', 'sv'),
-]
+)
 
 # Available UI Themes (display_name, filename)
-AVAILABLE_THEMES = [
+AVAILABLE_THEMES = (
     # Light themes
     ('Light Blue', 'light_blue.xml'),
     ('Light Cyan', 'light_cyan.xml'),
@@ -63,7 +63,10 @@ AVAILABLE_THEMES = [
     ('Dark Red', 'dark_red.xml'),
     ('Dark Teal', 'dark_teal.xml'),
     ('Dark Yellow', 'dark_yellow.xml'),
-]
+)
+
+# Supported input file extensions (lowercase; matching is case-insensitive)
+SUPPORTED_FILE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.bmp', '.gif', '.tiff', '.tif', '.pdf')
 
 # QSettings Keys
 SETTINGS_DET_MODEL = 'ocr/detection_model'
@@ -72,6 +75,8 @@ SETTINGS_LANGUAGE = 'ocr/language'
 SETTINGS_THEME = 'ui/theme'
 SETTINGS_EXPLORER_DIR = 'ui/explorer_last_directory'
 SETTINGS_SPLITTER_SIZES = 'ui/splitter_sizes'
+SETTINGS_CACHE_ENABLED = 'ocr/cache_enabled'
+SETTINGS_CACHE_MAX_MB = 'ocr/cache_max_mb'
 
 # Default Values
 DEFAULT_DET_MODEL = 'PP-OCRv4_mobile_det'
@@ -79,3 +84,5 @@ DEFAULT_REC_MODEL = 'en_PP-OCRv4_mobile_rec'
 DEFAULT_LANGUAGE = 'en'
 DEFAULT_THEME = 'light_blue.xml'
 DEFAULT_SPLITTER_SIZES = [200, 450, 350]
+DEFAULT_CACHE_ENABLED = True
+DEFAULT_CACHE_MAX_MB = 200
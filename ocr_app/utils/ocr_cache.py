@@ -0,0 +1,115 @@
+"""On-disk cache of OCR results keyed by image content and OCR parameters"""
+import hashlib
+import json
+import logging
+import os
+import tempfile
+
+from PySide6.QtCore import QStandardPaths
+
+from ocr_app.utils.constants import DEFAULT_CACHE_MAX_MB
+
+# Bump when the OCR engine options or the cached result format change
+CACHE_FORMAT_VERSION = 1
+
+_log = logging.getLogger('lifttext.ocr_cache')
+
+
+def get_cache_dir():
+    """Return the directory holding cached OCR results (created on demand)"""
+    # The generic location doesn't depend on QApplication's name settings, so the
+    # cache lands in .../LiftText/ocr however the app was launched
+    base = QStandardPaths.writableLocation(QStandardPaths.GenericCacheLocation) or tempfile.gettempdir()
+    cache_dir = os.path.join(base, 'LiftText', 'ocr')
+    os.makedirs(cache_dir, exist_ok=True)
+    return cache_dir
+
+
+def cache_key(image_path, ocr_params):
+    """Build a cache key from the image bytes and the OCR parameters"""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(image_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+
+    params = json.dumps({'version': CACHE_FORMAT_VERSION, **ocr_params}, sort_keys=True)
+    params_hash = hashlib.sha1(params.encode('utf-8')).hexdigest()[:16]
+    return f"{digest.hexdigest()}_{params_hash}"
+
+
+def load(key):
+    """Return the cached result for key, or None"""
+    path = os.path.join(get_cache_dir(), f"{key}.json")
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            result = json.load(f)
+        os.utime(path)  # Mark as recently used for eviction
+        return result
+    except (OSError, ValueError):
+        return None
+
+
+def store(key, result, max_mb):
+    """Save a result under key, then evict least recently used entries beyond max_mb"""
+    cache_dir = get_cache_dir()
+    path = os.path.join(cache_dir, f"{key}.json")
+
+    # Write to a temp file first so a crash never leaves a truncated entry
+    fd, temp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(result, f)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+
+    evict(cache_dir, max_mb * 1024 * 1024)
+
+
+def evict(cache_dir, max_bytes):
+    """Delete the least recently used entries until the cache fits in max_bytes"""
+    entries = []
+    with os.scandir(cache_dir) as it:
+        for entry in it:
+            if entry.name.endswith('.json'):
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue  # Removed by another worker or by hand since the listing
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+            total -= size
+        except OSError:
+            pass
+
+
+def get_or_run(image_path, ocr_params, run_ocr, use_cache=True, max_mb=DEFAULT_CACHE_MAX_MB):
+    """Return the cached result for this image and parameters, or call run_ocr() and cache it.
+
+    Results must be JSON-serializable. Cache failures never block OCR.
+    """
+    if not use_cache:
+        return run_ocr()
+
+    try:
+        key = cache_key(image_path, ocr_params)
+        result = load(key)
+    except OSError as e:
+        _log.warning("OCR cache unavailable: %s", e)
+        return run_ocr()
+    if result is not None:
+        return result
+
+    result = run_ocr()
+    try:
+        store(key, result, max_mb)
+    except (OSError, TypeError, ValueError) as e:
+        _log.warning("Could not cache OCR result: %s", e)
+    return result
@@ -1,18 +1,33 @@
 """Resource and model setup utilities for PyInstaller bundles"""
 import sys
 import os
+import logging
+import mmap
+import threading
+
+# Model weight files worth pulling into the page cache before the first scan
+MODEL_WEIGHT_EXTENSIONS = ('.pdiparams', '.pdmodel', '.onnx')
+
+# Cap on CPU inference threads; the mobile models gain nothing from more and
+# oversubscribing every core thrashes the caches
+OCR_MAX_THREADS = 4
+
+# PyInstaller unpacks the bundle to a folder stored in sys._MEIPASS; resolved once
+_MEIPASS = getattr(sys, '_MEIPASS', None)
+# Running as normal script: resources are relative to the launch directory
+_BASE_PATH = _MEIPASS or os.path.abspath(".")
+
+_bundled_models_dir = None  # Set by the first successful setup_bundled_models() call
+
+_log = logging.getLogger('lifttext.resources')
+if _MEIPASS:
+    # Bundled app: skip info messages on the launch path, only surface problems
+    _log.setLevel(logging.WARNING)
 
 
 def get_resource_path(relative_path):
     """Get absolute path to resource, works for dev and PyInstaller bundle."""
-    try:
-        # PyInstaller creates a temp folder and stores path in _MEIPASS
-        base_path = sys._MEIPASS
-    except AttributeError:
-        # Running as normal script
-        base_path = os.path.abspath(".")
-
-    return os.path.join(base_path, relative_path)
+    return os.path.join(_BASE_PATH, relative_path)
 
 
 def setup_bundled_models():
@@ -20,17 +35,53 @@ def setup_bundled_models():
     Configure OCR engine to use bundled models when running as .app bundle.
     MUST be called BEFORE importing paddleocr module.
     """
-    if hasattr(sys, '_MEIPASS'):
+    global _bundled_models_dir
+
+    # Thread pools are sized when paddle's native libraries load, so this has to
+    # happen before the import; setdefault keeps any value the user exported
+    threads = str(min(OCR_MAX_THREADS, os.cpu_count() or OCR_MAX_THREADS))
+    for var in ('OMP_NUM_THREADS', 'MKL_NUM_THREADS', 'OPENBLAS_NUM_THREADS'):
+        os.environ.setdefault(var, threads)
+
+    if _bundled_models_dir:
+        return _bundled_models_dir  # Already configured (and prefetch started)
+
+    if _MEIPASS:
         # Running as PyInstaller bundle
-        bundled_models_dir = os.path.join(sys._MEIPASS, 'models')
+        bundled_models_dir = os.path.join(_MEIPASS, 'models')
 
         if os.path.exists(bundled_models_dir):
             # Set environment variable BEFORE importing paddleocr
             os.environ['PADDLE_PDX_CACHE_HOME'] = bundled_models_dir
-            print(f"Using bundled models from: {bundled_models_dir}")
+            _log.info("Using bundled models from: %s", bundled_models_dir)
+
+            # Warm the page cache with model weights while the UI starts up
+            threading.Thread(target=prefetch_model_files, args=(bundled_models_dir,),
+                             daemon=True).start()
+            _bundled_models_dir = bundled_models_dir
             return bundled_models_dir
         else:
-            print(f"WARNING: Bundled models not found at {bundled_models_dir}")
-            print("LiftText will try to download models from internet...")
+            _log.warning("Bundled models not found at %s; LiftText will try to download models from internet",
+                         bundled_models_dir)
 
     return None
+
+
+def prefetch_model_files(models_dir):
+    """Ask the OS to read model weights under models_dir into the page cache in the background"""
+    if not hasattr(mmap, 'MADV_WILLNEED'):
+        return  # madvise not available on this platform
+
+    for root, _, files in os.walk(models_dir):
+        for name in files:
+            if not name.endswith(MODEL_WEIGHT_EXTENSIONS):
+                continue
+            path = os.path.join(root, name)
+            try:
+                # The read-ahead fills the page cache, which outlives the mapping,
+                # so the mapping can be closed as soon as the advice is given
+                with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    mapped.madvise(mmap.MADV_WILLNEED)
+            except (OSError, ValueError) as e:
+                # Empty files can't be mapped; prefetching is best-effort either way
+                _log.warning("Could not prefetch %s: %s", path, e)
@@ -3,43 +3,56 @@ py2app setup file for LiftText macOS application
 """
 from setuptools import setup
 from pathlib import Path
-import subprocess
+import importlib.util
 import os
+import subprocess
 import sys
 
 # Increase recursion limit for py2app's module graph analysis
 sys.setrecursionlimit(10000)
 
+# Model defaults come from the app itself so the bundle always carries them
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from ocr_app.utils.constants import DEFAULT_DET_MODEL, DEFAULT_REC_MODEL
+
 # Paths
 home = Path.home()
 models_dir = home / '.paddlex' / 'official_models'
 
 # Collect PaddleOCR models
-MODEL_DATA = []
 default_models = [
-    'PP-OCRv4_mobile_det',
-    'en_PP-OCRv4_mobile_rec',
-    'PP-LCNet_x1_0_textline_ori',
+    DEFAULT_DET_MODEL,
+    DEFAULT_REC_MODEL,
+    'PP-LCNet_x1_0_textline_ori',  # Text line orientation (use_textline_orientation=True)
 ]
 
-for model_name in default_models:
-    model_path = models_dir / model_name
-    if model_path.exists():
-        MODEL_DATA.append(str(model_path))
+# One directory listing instead of a stat per model name
+try:
+    with os.scandir(models_dir) as entries:
+        existing_models = {entry.name for entry in entries}
+except OSError:
+    existing_models = set()  # No models downloaded yet
+
+MODEL_DATA = [str(models_dir / model_name) for model_name in default_models if model_name in existing_models]
+
+# Fail the build early rather than ship an app that downloads models on first scan
+missing_models = [model_name for model_name in default_models if model_name not in existing_models]
+if missing_models and 'py2app' in sys.argv:
+    sys.exit(f"Error: Default models missing from {models_dir}: {', '.join(missing_models)}\n"
+             "Run ./setup.sh (or one OCR scan) to download them before building.")
 
 # Get package paths without importing (avoids loading huge dependency trees)
 def get_package_path(package_name):
-    """Get package path using subprocess to avoid import side effects."""
+    """Get package path from its import spec (finds the package without executing it)."""
     try:
-        result = subprocess.run(
-            [sys.executable, '-c', f'import {package_name}; print({package_name}.__file__)'],
-            capture_output=True, text=True, timeout=30
-        )
-        if result.returncode == 0:
-            return Path(result.stdout.strip()).parent
-    except Exception as e:
+        spec = importlib.util.find_spec(package_name)
+    except (ImportError, ValueError) as e:
         print(f"Warning: Could not find {package_name}: {e}")
-    return None
+        return None
+    if spec is None or not spec.origin:
+        print(f"Warning: Could not find {package_name}")
+        return None
+    return Path(spec.origin).parent
 
 paddlex_root = get_package_path('paddlex')
 configs_dir = paddlex_root / 'configs' if paddlex_root else None
@@ -119,6 +132,10 @@ OPTIONS = {
         'setuptools',
         'pip',
         'wheel',
+        # Bundled test suites (never imported at runtime)
+        'numpy.tests',
+        'pandas.tests',
+        'sklearn.tests',
     ],
     'resources': [
         r for r in [
@@ -131,6 +148,35 @@ OPTIONS = {
     'site_packages': True,
 }
 
+
+def strip_bundle_libraries(app_path):
+    """Strip debug symbols from the bundled dylibs/.so files, then ad-hoc re-sign the app.
+
+    Smaller binaries mean less to page in and link on first launch. Libraries are
+    not UPX-packed: that would make every launch decompress them in memory.
+    """
+    contents = app_path / 'Contents'
+    for lib in [*contents.rglob('*.dylib'), *contents.rglob('*.so')]:
+        if lib.is_symlink():
+            continue
+        try:
+            result = subprocess.run(['strip', '-S', '-x', str(lib)], capture_output=True, text=True)
+        except FileNotFoundError:
+            print("Warning: strip not found (install the Xcode command line tools); libraries left unstripped")
+            return  # Nothing was modified, so the existing signatures are still valid
+        if result.returncode != 0:
+            print(f"Warning: Could not strip {lib}: {result.stderr.strip()}")
+
+    # Stripping invalidates existing signatures, which macOS refuses to load
+    try:
+        subprocess.run(['codesign', '--force', '--deep', '--sign', '-', str(app_path)],
+                       capture_output=True, text=True, check=True)
+    except FileNotFoundError:
+        print(f"Warning: codesign not found; re-sign {app_path} before running it")
+    except subprocess.CalledProcessError as e:
+        print(f"Warning: Could not re-sign {app_path}: {e.stderr.strip()}")
+
+
 setup(
     name='LiftText',
     app=APP,
@@ -138,3 +184,9 @@ setup(
     options={'py2app': OPTIONS},
     setup_requires=['py2app'],
 )
+
+# Alias builds (-A) link back to the source tree, which must not be modified
+if 'py2app' in sys.argv and sys.platform == 'darwin' and not {'-A', '--alias'} & set(sys.argv):
+    app_bundle = Path('dist') / 'LiftText.app'
+    if app_bundle.exists():
+        strip_bundle_libraries(app_bundle)
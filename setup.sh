@@ -25,6 +25,16 @@ pip install --upgrade pip
 echo "Installing dependencies..."
 pip install -r requirements.txt
 
+# Download the default OCR models now so the first scan doesn't have to
+# (building the engine fetches any missing weights into ~/.paddlex)
+echo "Downloading default OCR models..."
+python - <<'PYEOF' || echo "Warning: Could not download OCR models. They will be downloaded on first use."
+from ocr_app.core.ocr_worker import get_ocr_engine
+from ocr_app.utils.constants import DEFAULT_DET_MODEL, DEFAULT_REC_MODEL, DEFAULT_LANGUAGE
+
+get_ocr_engine(DEFAULT_DET_MODEL, DEFAULT_REC_MODEL, DEFAULT_LANGUAGE)
+PYEOF
+
 echo ""
 echo "Setup completed successfully!"
 echo ""